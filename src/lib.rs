@@ -1,17 +1,24 @@
 // Standard library imports
-use std::collections::hash_map::IntoIter;
-use std::collections::{HashMap, HashSet};
+use std::borrow::Cow;
+use std::collections::hash_map::Entry;
+use std::collections::{BTreeMap, HashMap, HashSet};
 use std::fs::File;
 use std::io::{BufReader, BufWriter, Write};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 //use std::path::Path;
 
 // External crate imports
 use anyhow::{anyhow, Result};
 use log::debug;
+use memmap2::Mmap;
 use niffler::compression::Format;
 use niffler::get_writer;
+use nohash_hasher::BuildNoHashHasher;
+use numpy::PyArray1;
 use pyo3::exceptions::{PyIOError, PyKeyError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use pyo3::IntoPyObjectExt;
 use pyo3::PyResult;
 use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
@@ -22,65 +29,402 @@ use sourmash::signature::SeqToHashes;
 // Set version variable
 const VERSION: &str = env!("CARGO_PKG_VERSION");
 
-#[pyclass]
+// Counts are keyed by already-uniform murmur64 hash values, so the map
+// can use the key directly instead of re-hashing it through SipHash.
+// Counts are stored as u32 (saturating) to halve the value payload;
+// they are widened back to u64 at the Python boundary.
+type CountMap = HashMap<u64, u32, BuildNoHashHasher<u64>>;
+
+// The string-form k-mer map is keyed by the same murmur64 values, so it
+// skips SipHash as well; the String payloads are never hashed.
+type StringKmerMap = HashMap<u64, String, BuildNoHashHasher<u64>>;
+
+// 2-bit codes for DNA bases (A=00, C=01, G=10, T=11), upper- and
+// lowercase accepted; 0xFF marks an invalid character.
+const fn build_base_code() -> [u8; 256] {
+    let mut table = [0xFFu8; 256];
+    table[b'A' as usize] = 0;
+    table[b'a' as usize] = 0;
+    table[b'C' as usize] = 1;
+    table[b'c' as usize] = 1;
+    table[b'G' as usize] = 2;
+    table[b'g' as usize] = 2;
+    table[b'T' as usize] = 3;
+    table[b't' as usize] = 3;
+    table
+}
+static BASE_CODE: [u8; 256] = build_base_code();
+
+// Decode table matching the 2-bit base codes above.
+static BASE_CHAR: [u8; 4] = *b"ACGT";
+
+// Uppercase complement of each ASCII base (lowercase accepted); 0xFF
+// marks an invalid character. Used by the k > 32 canon fallback.
+const fn build_complement() -> [u8; 256] {
+    let mut table = [0xFFu8; 256];
+    table[b'A' as usize] = b'T';
+    table[b'a' as usize] = b'T';
+    table[b'C' as usize] = b'G';
+    table[b'c' as usize] = b'G';
+    table[b'G' as usize] = b'C';
+    table[b'g' as usize] = b'C';
+    table[b'T' as usize] = b'A';
+    table[b't' as usize] = b'A';
+    table
+}
+static COMPLEMENT: [u8; 256] = build_complement();
+
+// Sequences at least this long are hashed in parallel during consume.
+const PARALLEL_SEQ_THRESHOLD: usize = 1 << 16;
+
+/// Pack a DNA k-mer (k <= 32) into 2 bits per base, first base in the
+/// high bits so that integer order matches lexicographic order.
+/// Returns None if the k-mer contains a non-ACGT character.
+#[inline]
+fn pack_kmer_2bit(kmer: &[u8]) -> Option<u64> {
+    let mut packed: u64 = 0;
+    // OR-accumulate the invalid sentinel instead of branching per base;
+    // the table also folds lowercasing, so no separate uppercase pass.
+    let mut invalid: u8 = 0;
+    for &base in kmer {
+        let code = BASE_CODE[base as usize];
+        invalid |= code;
+        packed = (packed << 2) | (code & 3) as u64;
+    }
+    if invalid & 0xFC != 0 {
+        return None;
+    }
+    Some(packed)
+}
+
+/// Reverse complement of a 2-bit packed k-mer, without per-base branching.
+/// Complement is a bitwise NOT in this encoding (A<->T, C<->G); the base
+/// order is reversed with a bit-reversal plus an adjacent-bit swap to
+/// restore each 2-bit group.
+#[inline]
+fn revcomp_2bit(packed: u64, ksize: usize) -> u64 {
+    let comp = !packed;
+    let rev = comp.reverse_bits();
+    let swapped = ((rev & 0xAAAA_AAAA_AAAA_AAAA) >> 1) | ((rev & 0x5555_5555_5555_5555) << 1);
+    swapped >> (64 - 2 * ksize)
+}
+
+/// Decode a 2-bit packed k-mer back to its ASCII representation.
+#[inline]
+fn unpack_kmer_2bit(packed: u64, ksize: usize) -> String {
+    let mut out = Vec::with_capacity(ksize);
+    for i in (0..ksize).rev() {
+        out.push(BASE_CHAR[((packed >> (2 * i)) & 3) as usize]);
+    }
+    String::from_utf8(out).expect("2-bit decode produced invalid utf-8")
+}
+
+/// Magic bytes opening the framed binary save format; the trailing byte
+/// is the format revision.
+const BINARY_MAGIC: &[u8] = b"OXLI\x01";
+
+/// Bounds-checked sequential reader over a byte slice, used when parsing
+/// the framed binary save format.
+struct SlabReader<'a> {
+    data: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> SlabReader<'a> {
+    fn bytes(&mut self, len: usize) -> Result<&'a [u8]> {
+        let end = self
+            .pos
+            .checked_add(len)
+            .filter(|&end| end <= self.data.len())
+            .ok_or_else(|| anyhow!("Deserialization error: truncated file"))?;
+        let out = &self.data[self.pos..end];
+        self.pos = end;
+        Ok(out)
+    }
+
+    fn slab(&mut self, n: usize, width: usize) -> Result<&'a [u8]> {
+        let len = n
+            .checked_mul(width)
+            .ok_or_else(|| anyhow!("Deserialization error: truncated file"))?;
+        self.bytes(len)
+    }
+
+    fn u8(&mut self) -> Result<u8> {
+        Ok(self.bytes(1)?[0])
+    }
+
+    fn u32(&mut self) -> Result<u32> {
+        Ok(u32::from_le_bytes(self.bytes(4)?.try_into().unwrap()))
+    }
+
+    fn u64(&mut self) -> Result<u64> {
+        Ok(u64::from_le_bytes(self.bytes(8)?.try_into().unwrap()))
+    }
+}
+
+/// Hash every k-mer window of a sequence with murmur64, skipping windows
+/// containing invalid bases (they hash to 0 under force mode).
+fn hash_sequence(seq: &[u8], ksize: usize) -> PyResult<Vec<u64>> {
+    if seq.len() < ksize {
+        return Ok(vec![]);
+    }
+    let hashes = SeqToHashes::new(seq, ksize, true, false, HashFunctions::Murmur64Dna, 42);
+    let mut hashvals: Vec<u64> = Vec::with_capacity(seq.len() - ksize + 1);
+    for hash_value in hashes {
+        match hash_value {
+            Ok(0) => continue,
+            Ok(x) => hashvals.push(x),
+            Err(_) => {
+                let msg = format!("bad k-mer encountered at position {}", hashvals.len());
+                return Err(PyValueError::new_err(msg));
+            }
+        }
+    }
+    Ok(hashvals)
+}
+
+/// Write a file through a memory mapping sized to an upper bound, then
+/// truncate to the length actually written. `fill` formats records into
+/// the mapping and returns the number of bytes used. Avoids a write
+/// syscall and a buffer copy per flushed block compared to BufWriter.
+///
+/// Non-regular targets (FIFOs, /dev/null and other device files) cannot
+/// be set_len'd or mapped; for those, format into a heap buffer of the
+/// same size and stream it out instead.
+fn write_mapped<F>(filepath: &str, capacity: usize, fill: F) -> std::io::Result<()>
+where
+    F: FnOnce(&mut [u8]) -> usize,
+{
+    let f = std::fs::OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(true)
+        .open(filepath)?;
+    if capacity == 0 {
+        return Ok(());
+    }
+    if !f.metadata()?.is_file() {
+        let mut buf = vec![0u8; capacity];
+        let written = fill(&mut buf);
+        let mut writer = BufWriter::with_capacity(1 << 20, f);
+        writer.write_all(&buf[..written])?;
+        return writer.flush();
+    }
+    f.set_len(capacity as u64)?;
+    let mut mm = unsafe { memmap2::MmapMut::map_mut(&f)? };
+    let written = fill(&mut mm);
+    mm.flush()?;
+    drop(mm);
+    f.set_len(written as u64)
+}
+
+/// Copy `field` plus a one-byte separator into `buf` at `pos`, returning
+/// the number of bytes written.
+fn write_field(buf: &mut [u8], pos: usize, field: &[u8], sep: u8) -> usize {
+    buf[pos..pos + field.len()].copy_from_slice(field);
+    buf[pos + field.len()] = sep;
+    field.len() + 1
+}
+
+/// Storage for the optional hash -> canonical k-mer mapping. For k <= 32
+/// the canonical k-mer is kept 2-bit packed in a u64 (8 bytes per entry
+/// instead of a heap-allocated String) and decoded on demand; longer
+/// k-mers fall back to string storage. Both variants serialize as a
+/// hash -> string map, so the on-disk JSON format is unchanged.
+#[derive(Debug)]
+enum KmerMap {
+    Packed {
+        ksize: usize,
+        map: HashMap<u64, u64, BuildNoHashHasher<u64>>,
+    },
+    Strings(StringKmerMap),
+}
+
+impl KmerMap {
+    fn new(ksize: usize) -> Self {
+        if (1..=32).contains(&ksize) {
+            KmerMap::Packed {
+                ksize,
+                map: HashMap::default(),
+            }
+        } else {
+            KmerMap::Strings(StringKmerMap::default())
+        }
+    }
+
+    /// Store a canonical k-mer only if its hash is not already present.
+    /// Canonical k-mers are ACGT-only, so packing cannot fail in the
+    /// packed variant.
+    fn insert_if_absent(&mut self, hash: u64, kmer: &str) {
+        match self {
+            KmerMap::Packed { map, .. } => {
+                map.entry(hash).or_insert_with(|| {
+                    pack_kmer_2bit(kmer.as_bytes()).expect("canonical k-mer is ACGT-only")
+                });
+            }
+            KmerMap::Strings(map) => {
+                map.entry(hash).or_insert_with(|| kmer.to_string());
+            }
+        }
+    }
+
+    /// Look up the canonical k-mer for a hash, decoding if packed.
+    fn get(&self, hash: u64) -> Option<String> {
+        match self {
+            KmerMap::Packed { ksize, map } => map
+                .get(&hash)
+                .map(|&packed| unpack_kmer_2bit(packed, *ksize)),
+            KmerMap::Strings(map) => map.get(&hash).cloned(),
+        }
+    }
+
+    /// Carry over all entries from another map, keeping existing ones.
+    fn merge(&mut self, other: &KmerMap) {
+        match (self, other) {
+            (KmerMap::Packed { map, .. }, KmerMap::Packed { map: other_map, .. }) => {
+                for (&hash, &packed) in other_map.iter() {
+                    map.entry(hash).or_insert(packed);
+                }
+            }
+            (this, other) => {
+                // Mixed representations only arise for tables of different
+                // ksize, which add() rejects; handle them anyway by decoding.
+                for (hash, kmer) in other.decoded_pairs() {
+                    this.insert_if_absent(hash, &kmer);
+                }
+            }
+        }
+    }
+
+    /// All (hash, decoded k-mer) pairs, in map order.
+    fn decoded_pairs(&self) -> Vec<(u64, String)> {
+        match self {
+            KmerMap::Packed { ksize, map } => map
+                .iter()
+                .map(|(&hash, &packed)| (hash, unpack_kmer_2bit(packed, *ksize)))
+                .collect(),
+            KmerMap::Strings(map) => map
+                .iter()
+                .map(|(&hash, kmer)| (hash, kmer.clone()))
+                .collect(),
+        }
+    }
+}
+
+impl Serialize for KmerMap {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        // Always serialize as hash -> string for file-format stability.
+        match self {
+            KmerMap::Packed { ksize, map } => serializer.collect_map(
+                map.iter()
+                    .map(|(&hash, &packed)| (hash, unpack_kmer_2bit(packed, *ksize))),
+            ),
+            KmerMap::Strings(map) => serializer.collect_map(map.iter()),
+        }
+    }
+}
+
+impl<'de> Deserialize<'de> for KmerMap {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        let strings: StringKmerMap = StringKmerMap::deserialize(deserializer)?;
+
+        // Re-pack when every k-mer fits the 2-bit encoding; an empty map
+        // has no ksize to recover, so it stays in string form.
+        let ksize = match strings.values().next() {
+            Some(kmer) if (1..=32).contains(&kmer.len()) => kmer.len(),
+            _ => return Ok(KmerMap::Strings(strings)),
+        };
+        let mut map: HashMap<u64, u64, BuildNoHashHasher<u64>> = HashMap::default();
+        map.reserve(strings.len());
+        for (hash, kmer) in strings.iter() {
+            match pack_kmer_2bit(kmer.as_bytes()) {
+                Some(packed) if kmer.len() == ksize => {
+                    map.insert(*hash, packed);
+                }
+                _ => return Ok(KmerMap::Strings(strings)),
+            }
+        }
+        Ok(KmerMap::Packed { ksize, map })
+    }
+}
+
+#[pyclass(module = "oxli")]
 #[derive(Serialize, Deserialize, Debug)]
 /// Basic KmerCountTable struct, mapping hashes to counts.
 struct KmerCountTable {
-    counts: HashMap<u64, u64>,
+    counts: CountMap,
     pub ksize: u8,
     version: String,
     consumed: u64,
     store_kmers: bool, // Store hash:kmer mapping if true
-    hash_to_kmer: Option<HashMap<u64, String>>,
+    hash_to_kmer: Option<KmerMap>,
+    // Cached min/max over the count values, recomputed lazily after
+    // mutations so repeated attribute access is O(1) instead of a full
+    // value scan. Atomics give the &self getters interior mutability;
+    // the caches are skipped on disk and start dirty after a load.
+    #[serde(skip, default = "dirty_cache")]
+    minmax_dirty: AtomicBool,
+    #[serde(skip)]
+    min_cache: AtomicU64,
+    #[serde(skip)]
+    max_cache: AtomicU64,
+}
+
+/// Loaded and freshly built tables start with stale min/max caches.
+fn dirty_cache() -> AtomicBool {
+    AtomicBool::new(true)
 }
 
 #[pymethods]
 impl KmerCountTable {
     /// Constructor for KmerCountTable
     #[new]
-    #[pyo3(signature = (ksize, store_kmers=false))]
-    pub fn new(ksize: u8, store_kmers: bool) -> Self {
+    #[pyo3(signature = (ksize, store_kmers=false, capacity=None))]
+    pub fn new(ksize: u8, store_kmers: bool, capacity: Option<usize>) -> Self {
         // Optional init HashMap for tracking hash:kmer pairs
         let hash_to_kmer = if store_kmers {
-            Some(HashMap::new())
+            Some(KmerMap::new(ksize as usize))
         } else {
             None
         };
+        // Pre-size the counts map when the caller knows roughly how many
+        // distinct k-mers to expect, avoiding rehashes during loading.
+        let counts = match capacity {
+            Some(capacity) => {
+                CountMap::with_capacity_and_hasher(capacity, BuildNoHashHasher::default())
+            }
+            None => CountMap::default(),
+        };
         // Init new KmerCountTable
         Self {
-            counts: HashMap::new(),
+            counts,
             ksize,
             version: VERSION.to_string(), // Initialize the version field
             consumed: 0,                  // Initialize the total sequence length tracker
             store_kmers,
             hash_to_kmer,
+            minmax_dirty: dirty_cache(),
+            min_cache: AtomicU64::new(0),
+            max_cache: AtomicU64::new(0),
         }
     }
 
-    /// Turn a k-mer into a hashval.
-    pub fn hash_kmer(&self, kmer: String) -> Result<u64> {
-        if kmer.len() as u8 != self.ksize {
-            Err(anyhow!("wrong ksize"))
-        } else {
-            let mut hashes = SeqToHashes::new(
-                kmer.as_bytes(),
-                self.ksize.into(),
-                false,
-                false,
-                HashFunctions::Murmur64Dna,
-                42,
-            );
+    /// Reserve capacity for at least `n` additional distinct k-mers.
+    pub fn reserve(&mut self, n: usize) {
+        self.counts.reserve(n);
+    }
 
-            let hashval = hashes.next().expect("error hashing this k-mer");
-            Ok(hashval?)
-        }
+    /// Turn a k-mer into a hashval.
+    pub fn hash_kmer(&self, kmer: &str) -> Result<u64> {
+        self.hash_kmer_bytes(kmer.as_bytes())
     }
 
     /// Unhash function to retrieve the canonical kmer for a given hash
     pub fn unhash(&self, hash: u64) -> PyResult<String> {
         if self.store_kmers {
-            if let Some(kmer) = self.hash_to_kmer.as_ref().unwrap().get(&hash) {
-                Ok(kmer.clone())
+            if let Some(kmer) = self.hash_to_kmer.as_ref().unwrap().get(hash) {
+                Ok(kmer)
             } else {
                 // Raise KeyError if hash does not exist
                 let msg = format!("Warning: Hash {} not found in table.", hash);
@@ -94,9 +438,23 @@ impl KmerCountTable {
 
     /// Increment the count of a hashval by 1.
     pub fn count_hash(&mut self, hashval: u64) -> u64 {
+        self.touch_counts();
         let count = self.counts.entry(hashval).or_insert(0);
-        *count += 1;
-        *count
+        *count = count.saturating_add(1);
+        u64::from(*count)
+    }
+
+    /// Increment the counts of a batch of hashvals in a single call.
+    /// Returns the number of hashvals counted.
+    pub fn count_hashes(&mut self, hashvals: Vec<u64>) -> u64 {
+        self.touch_counts();
+        // Reserve capacity up front to avoid incremental rehashing.
+        self.counts.reserve(hashvals.len());
+        for hashval in &hashvals {
+            let count = self.counts.entry(*hashval).or_insert(0);
+            *count = count.saturating_add(1);
+        }
+        hashvals.len() as u64
     }
 
     /// Return the canonical form of a k-mer: the lexicographically smaller of the k-mer or its reverse complement.
@@ -108,26 +466,34 @@ impl KmerCountTable {
             ));
         }
 
-        // Convert k-mer to uppercase
-        let kmer_upper = kmer.to_uppercase();
+        let ksize = kmer.len();
 
-        // Ensure k-mer contains only valid DNA characters
-        if !kmer_upper.chars().all(|c| "ATCG".contains(c)) {
-            return Err(PyValueError::new_err("kmer contains invalid characters"));
+        // Fast path: pack into 2 bits per base and reverse-complement with
+        // bit tricks instead of walking characters.
+        if (1..=32).contains(&ksize) {
+            let fwd = pack_kmer_2bit(kmer.as_bytes())
+                .ok_or_else(|| PyValueError::new_err("kmer contains invalid characters"))?;
+            let rc = revcomp_2bit(fwd, ksize);
+
+            // Integer order on the packed form matches lexicographic order.
+            return Ok(unpack_kmer_2bit(fwd.min(rc), ksize));
         }
 
-        // Compute the reverse complement
-        let rev_comp: String = kmer_upper
-            .chars()
-            .rev()
-            .map(|c| match c {
-                'A' => 'T',
-                'T' => 'A',
-                'C' => 'G',
-                'G' => 'C',
-                _ => c, // This should not happen due to earlier validation
-            })
-            .collect();
+        // Fallback for k > 32: complement through a byte lookup table,
+        // which validates, uppercases and complements in one load per base.
+        let bytes = kmer.as_bytes();
+        let mut rev_comp = Vec::with_capacity(ksize);
+        for &base in bytes.iter().rev() {
+            let comp = COMPLEMENT[base as usize];
+            if comp == 0xFF {
+                return Err(PyValueError::new_err("kmer contains invalid characters"));
+            }
+            rev_comp.push(comp);
+        }
+        let rev_comp = String::from_utf8(rev_comp).expect("complement table is ASCII");
+        // The LUT above validated every byte as ACGT/acgt, so ASCII-only
+        // uppercasing is sufficient and skips the Unicode machinery.
+        let kmer_upper = kmer.to_ascii_uppercase();
 
         // Return the lexicographically smaller of kmer or its reverse complement
         if kmer_upper <= rev_comp {
@@ -138,59 +504,102 @@ impl KmerCountTable {
     }
 
     /// Increment the count of a k-mer by 1.
-    pub fn count(&mut self, kmer: String) -> PyResult<u64> {
+    pub fn count(&mut self, kmer: &str) -> PyResult<u64> {
         if kmer.len() as u8 != self.ksize {
             Err(PyValueError::new_err(
                 "kmer size does not match count table ksize",
             ))
         } else {
-            let hashval = self.hash_kmer(kmer.clone())?; // Clone the kmer before passing it to hash_kmer
+            // Hash the borrowed bytes; the store_kmers=False path never
+            // copies or canonicalizes the k-mer string.
+            let hashval = self.hash_kmer_bytes(kmer.as_bytes())?;
             let count = self.count_hash(hashval); // count with count_hash() function, return tally
             self.consumed += kmer.len() as u64; // Add kmer len to total consumed bases
 
             if self.store_kmers {
                 // Get the canonical k-mer
-                let canonical_kmer = self.canon(&kmer)?;
+                let canonical_kmer = self.canon(kmer)?;
                 // Optional: Store hash:kmer pair
                 self.hash_to_kmer
                     .as_mut()
                     .unwrap()
-                    .insert(hashval, canonical_kmer);
+                    .insert_if_absent(hashval, &canonical_kmer);
             }
 
             Ok(count) // Return the current total count for the hash
         }
     }
 
+    /// Increment the counts of a batch of k-mers in a single call,
+    /// validating and hashing each one in Rust. Returns the number of
+    /// k-mers counted.
+    pub fn count_many(&mut self, py: Python<'_>, kmers: Vec<String>) -> PyResult<u64> {
+        self.touch_counts();
+        // The counting loop touches no Python objects once the strings
+        // are extracted, so run it with the GIL released.
+        py.allow_threads(|| {
+            // Reserve capacity up front to avoid incremental rehashing.
+            self.counts.reserve(kmers.len());
+            for kmer in &kmers {
+                if kmer.len() as u8 != self.ksize {
+                    return Err(PyValueError::new_err(
+                        "kmer size does not match count table ksize",
+                    ));
+                }
+                let hashval = self.hash_kmer_bytes(kmer.as_bytes())?;
+                let count = self.counts.entry(hashval).or_insert(0);
+                *count = count.saturating_add(1);
+                self.consumed += kmer.len() as u64;
+
+                if self.store_kmers {
+                    let canonical_kmer = self.canon(kmer)?;
+                    self.hash_to_kmer
+                        .as_mut()
+                        .unwrap()
+                        .insert_if_absent(hashval, &canonical_kmer);
+                }
+            }
+            Ok(kmers.len() as u64)
+        })
+    }
+
     /// Retrieve the count of a k-mer.
-    pub fn get(&self, kmer: String) -> PyResult<u64> {
+    pub fn get(&self, kmer: &str) -> PyResult<u64> {
         if kmer.len() as u8 != self.ksize {
             Err(PyValueError::new_err(
                 "kmer size does not match count table ksize",
             ))
         } else {
-            let hashval = self.hash_kmer(kmer).expect("error hashing this k-mer");
+            let hashval = self
+                .hash_kmer_bytes(kmer.as_bytes())
+                .expect("error hashing this k-mer");
 
             let count = self.counts.get(&hashval).unwrap_or(&0);
             debug!("get: hashval {}, count {}", hashval, count);
-            Ok(*count)
+            Ok(u64::from(*count))
         }
     }
 
     /// Get the count for a specific hash value directly
     pub fn get_hash(&self, hashval: u64) -> u64 {
         // Return the count for the hash value, or 0 if it does not exist
-        *self.counts.get(&hashval).unwrap_or(&0)
+        u64::from(*self.counts.get(&hashval).unwrap_or(&0))
     }
 
     /// Get counts for a list of hashvals and return a list of counts
     pub fn get_hash_array(&self, hash_keys: Vec<u64>) -> Vec<u64> {
-        // Map each hash key to its count, defaulting to 0 if the key is not present
-        hash_keys.iter().map(|&key| self.get_hash(key)).collect()
+        // Single pass over the keys into a pre-sized output buffer; each
+        // lookup defaults to 0 if the key is not present.
+        let mut counts = Vec::with_capacity(hash_keys.len());
+        for key in hash_keys {
+            counts.push(u64::from(*self.counts.get(&key).unwrap_or(&0)));
+        }
+        counts
     }
 
     /// Drop a k-mer from the count table by its string representation
-    pub fn drop(&mut self, kmer: String) -> PyResult<()> {
+    pub fn drop(&mut self, kmer: &str) -> PyResult<()> {
+        self.touch_counts();
         // Compute the hash of the k-mer using the same method used for counting
         let hashval = self.hash_kmer(kmer)?;
         // Attempt to remove the k-mer's hash from the counts HashMap
@@ -207,6 +616,7 @@ impl KmerCountTable {
 
     /// Drop a k-mer from the count table by its hash value
     pub fn drop_hash(&mut self, hashval: u64) -> PyResult<()> {
+        self.touch_counts();
         // Attempt to remove the hash value from the counts HashMap
         if self.counts.remove(&hashval).is_some() {
             // If the hash value was successfully removed, log and return Ok
@@ -221,89 +631,135 @@ impl KmerCountTable {
 
     /// Remove all k-mers with counts less than a given threshold
     pub fn mincut(&mut self, min_count: u64) -> PyResult<u64> {
-        // Create a vector to store the keys (hashes) to be removed
-        let mut to_remove = Vec::new();
-
-        // Iterate over the HashMap and identify keys with counts less than the threshold
-        for (&hash, &count) in self.counts.iter() {
-            if count < min_count {
-                to_remove.push(hash);
-            }
-        }
-
-        // Remove the identified keys from the counts HashMap
-        for &hash in &to_remove {
-            self.counts.remove(&hash);
-        }
+        self.touch_counts();
+        // Filter in place: one pass over the flat entry storage with a
+        // simple compare, instead of collecting doomed keys and paying a
+        // second probe per removal.
+        let before = self.counts.len();
+        self.counts
+            .retain(|_, &mut count| u64::from(count) >= min_count);
 
         // Return the number of k-mers removed
-        Ok(to_remove.len() as u64)
+        Ok((before - self.counts.len()) as u64)
     }
 
     /// Remove all k-mers with counts greater than a given threshold
     pub fn maxcut(&mut self, max_count: u64) -> PyResult<u64> {
-        // Create a vector to store the keys (hashes) to be removed
-        let mut to_remove = Vec::new();
-
-        // Iterate over the HashMap and identify keys with counts greater than the threshold
-        for (&hash, &count) in self.counts.iter() {
-            if count > max_count {
-                to_remove.push(hash);
-            }
-        }
-
-        // Remove the identified keys from the counts HashMap
-        for &hash in &to_remove {
-            self.counts.remove(&hash);
-        }
+        self.touch_counts();
+        // Filter in place, as in mincut.
+        let before = self.counts.len();
+        self.counts
+            .retain(|_, &mut count| u64::from(count) <= max_count);
 
         // Return the number of k-mers removed
-        Ok(to_remove.len() as u64)
+        Ok((before - self.counts.len()) as u64)
     }
 
     /// Serialize the KmerCountTable as a JSON string
-    pub fn serialize_json(&self) -> Result<String> {
-        serde_json::to_string(&self).map_err(|e| anyhow::anyhow!("Serialization error: {}", e))
+    pub fn serialize_json(&self, py: Python<'_>) -> Result<String> {
+        py.allow_threads(|| {
+            serde_json::to_string(&self).map_err(|e| anyhow::anyhow!("Serialization error: {}", e))
+        })
     }
 
-    /// Save the KmerCountTable to a compressed file using Niffler.
-    pub fn save(&self, filepath: &str) -> PyResult<()> {
-        // Open the file for writing
-        let file = File::create(filepath).map_err(|e| PyIOError::new_err(e.to_string()))?;
-
-        // Create a Gzipped writer with niffler, using the default compression level
-        let writer = BufWriter::new(file);
-        let mut writer = get_writer(Box::new(writer), Format::Gzip, niffler::level::Level::One)
-            .map_err(|e| PyIOError::new_err(e.to_string()))?;
-
-        // Serialize the KmerCountTable to JSON
-        let json_data = self.serialize_json()?;
+    /// Save the KmerCountTable in the framed binary format: a fixed
+    /// header followed by raw little-endian hash and count slabs, written
+    /// once with no per-entry stringification. Legacy gzipped-JSON files
+    /// remain loadable; `save_json` still writes them.
+    pub fn save(&self, py: Python<'_>, filepath: &str) -> PyResult<()> {
+        // Release the GIL for the duration of the write; other Python
+        // threads can run while the slabs go to disk.
+        py.allow_threads(|| {
+            let file = File::create(filepath).map_err(|e| PyIOError::new_err(e.to_string()))?;
+            let mut writer = BufWriter::with_capacity(1 << 20, file);
+            self.write_binary(&mut writer)?;
+            writer.flush()?;
+            Ok(())
+        })
+    }
 
-        // Write the serialized JSON to the compressed file
-        writer
-            .write_all(json_data.as_bytes())
-            .map_err(|e| PyIOError::new_err(e.to_string()))?;
+    /// Save the KmerCountTable as gzipped JSON using Niffler, the format
+    /// written by oxli before the binary framing.
+    pub fn save_json(&self, py: Python<'_>, filepath: &str) -> PyResult<()> {
+        // Serialization and gzip compression run without the GIL held.
+        py.allow_threads(|| {
+            // Open the file for writing
+            let file = File::create(filepath).map_err(|e| PyIOError::new_err(e.to_string()))?;
+
+            // Create a Gzipped writer with niffler, using the default compression
+            // level; a 128 KiB buffer keeps compressed output from flushing to
+            // the file in small writes.
+            let writer = BufWriter::with_capacity(128 * 1024, file);
+            let mut writer = get_writer(Box::new(writer), Format::Gzip, niffler::level::Level::One)
+                .map_err(|e| PyIOError::new_err(e.to_string()))?;
+
+            // Serialize the KmerCountTable to JSON
+            let json_data = serde_json::to_string(&self)
+                .map_err(|e| anyhow::anyhow!("Serialization error: {}", e))?;
+
+            // Write the serialized JSON to the compressed file
+            writer
+                .write_all(json_data.as_bytes())
+                .map_err(|e| PyIOError::new_err(e.to_string()))?;
 
-        Ok(())
+            Ok(())
+        })
     }
 
     #[staticmethod]
-    /// Load a KmerCountTable from a compressed file using Niffler.
-    pub fn load(filepath: &str) -> Result<KmerCountTable> {
-        // Open the file for reading
-        let file = File::open(filepath)?;
+    /// Rebuild a KmerCountTable from framed binary bytes, as produced by
+    /// to_bytes(); used by pickle.
+    pub fn from_bytes(data: &[u8]) -> Result<KmerCountTable> {
+        if !data.starts_with(BINARY_MAGIC) {
+            return Err(anyhow!("Deserialization error: bad magic"));
+        }
+        KmerCountTable::read_binary(data)
+    }
 
-        // Use Niffler to get a reader that detects the compression format
-        let reader = BufReader::new(file);
-        let (mut reader, _format) = niffler::get_reader(Box::new(reader))?;
+    /// Serialize the table to framed binary bytes, the same layout save()
+    /// writes to disk.
+    pub fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let mut buf: Vec<u8> = Vec::new();
+        self.write_binary(&mut buf)?;
+        Ok(PyBytes::new(py, &buf))
+    }
 
-        // Read the decompressed data into a string
-        let mut decompressed_data = String::new();
-        reader.read_to_string(&mut decompressed_data)?;
+    /// Pickle support: round-trip through the framed binary format, so
+    /// pickling costs one slab copy rather than per-entry encoding.
+    pub fn __reduce__<'py>(
+        slf: PyRef<'py, Self>,
+    ) -> PyResult<(Bound<'py, PyAny>, (Bound<'py, PyBytes>,))> {
+        let py = slf.py();
+        let from_bytes = py.get_type::<KmerCountTable>().getattr("from_bytes")?;
+        Ok((from_bytes, (slf.to_bytes(py)?,)))
+    }
 
-        // Deserialize the JSON string to a KmerCountTable
-        let loaded_table: KmerCountTable = serde_json::from_str(&decompressed_data)
-            .map_err(|e| anyhow::anyhow!("Deserialization error: {}", e))?;
+    #[staticmethod]
+    /// Load a KmerCountTable, detecting the format from the file itself:
+    /// binary-framed files start with the magic bytes, anything else goes
+    /// through the legacy Niffler + JSON path.
+    pub fn load(py: Python<'_>, filepath: &str) -> Result<KmerCountTable> {
+        // Parsing (and, on the legacy path, decompression) touches no
+        // Python state, so run it with the GIL released.
+        let loaded_table = py.allow_threads(|| -> Result<KmerCountTable> {
+            // Open and map the file; the binary path parses slabs straight
+            // out of the mapping with no per-element decoding.
+            let file = File::open(filepath)?;
+            let mmap = unsafe { Mmap::map(&file)? };
+
+            if mmap.starts_with(BINARY_MAGIC) {
+                KmerCountTable::read_binary(&mmap)
+            } else {
+                // Use Niffler to get a reader that detects the compression format
+                let (reader, _format) = niffler::get_reader(Box::new(&mmap[..]))?;
+
+                // Stream-parse the JSON straight out of the decompressor, so
+                // the decompressed text is never buffered in full alongside
+                // the table being built.
+                serde_json::from_reader(BufReader::with_capacity(128 * 1024, reader))
+                    .map_err(|e| anyhow::anyhow!("Deserialization error: {}", e))
+            }
+        })?;
 
         // Check version compatibility and issue a warning if necessary
         if loaded_table.version != VERSION {
@@ -322,13 +778,18 @@ impl KmerCountTable {
     /// * `file` - Optional file path to write the output. If not provided, returns a list of tuples.
     /// * `sortkeys` - Optional flag to sort by hash keys (default: False).
     /// * `sortcounts` - Sort on counts, secondary sort on keys. (default: False).
-    #[pyo3(signature = (file=None, sortcounts=false, sortkeys=false))]
+    /// * `as_arrays` - Return a (hashes, counts) pair of numpy uint64 arrays
+    ///   instead of a list of tuples (default: False). Avoids allocating one
+    ///   Python tuple and two Python ints per entry on large tables.
+    #[pyo3(signature = (file=None, sortcounts=false, sortkeys=false, as_arrays=false))]
     pub fn dump(
         &self,
+        py: Python<'_>,
         file: Option<String>,
         sortcounts: bool,
         sortkeys: bool,
-    ) -> PyResult<Vec<(u64, u64)>> {
+        as_arrays: bool,
+    ) -> PyResult<PyObject> {
         // Raise an error if both sortcounts and sortkeys are true
         if sortcounts && sortkeys {
             return Err(PyValueError::new_err(
@@ -336,42 +797,113 @@ impl KmerCountTable {
             ));
         }
 
-        // Collect hashes and counts
-        let mut hash_count_pairs: Vec<(&u64, &u64)> = self.counts.iter().collect();
-
-        // Handle sorting based on the flags
-        if sortkeys {
-            // Sort by hash keys if `sortkeys` is set to true
-            hash_count_pairs.sort_by_key(|&(hash, _)| *hash);
-        } else if sortcounts {
-            // Sort by count, secondary sort by hash if `sortcounts` is true
-            hash_count_pairs.sort_by(|&(hash1, count1), &(hash2, count2)| {
-                count1.cmp(count2).then_with(|| hash1.cmp(hash2))
-            });
+        // If a file is provided, stream rows straight from the sorted key
+        // column (or the map itself) into the mapped file; no intermediate
+        // (hash, count) vector is ever materialized.
+        if let Some(filepath) = file {
+            // Map the file sized to the worst case (20 digits per integer),
+            // format rows straight into the mapping with itoa, then truncate
+            // to the bytes actually written: no stdio buffer copies and no
+            // per-record write syscalls.
+            let max_line = 20 + 1 + 20 + 1;
+            let cap = self.counts.len() * max_line;
+            let write_rows = |mm: &mut [u8], rows: &mut dyn Iterator<Item = (u64, u32)>| {
+                let mut int_buf = itoa::Buffer::new();
+                let mut pos = 0;
+                for (hash, count) in rows {
+                    pos += write_field(mm, pos, int_buf.format(hash).as_bytes(), b'\t');
+                    pos += write_field(mm, pos, int_buf.format(count).as_bytes(), b'\n');
+                }
+                pos
+            };
+
+            if sortkeys {
+                // Sort the bare key column and gather counts while writing.
+                let mut keys: Vec<u64> = self.counts.keys().copied().collect();
+                keys.sort_unstable();
+                write_mapped(&filepath, cap, |mm| {
+                    write_rows(mm, &mut keys.iter().map(|&hash| (hash, self.counts[&hash])))
+                })?;
+            } else if sortcounts {
+                // Sort packed (count, hash) keys and decode while writing.
+                let mut packed: Vec<u128> = self
+                    .counts
+                    .iter()
+                    .map(|(&hash, &count)| (u128::from(count) << 64) | u128::from(hash))
+                    .collect();
+                packed.sort_unstable();
+                write_mapped(&filepath, cap, |mm| {
+                    write_rows(
+                        mm,
+                        &mut packed.iter().map(|&p| (p as u64, (p >> 64) as u32)),
+                    )
+                })?;
+            } else {
+                write_mapped(&filepath, cap, |mm| {
+                    write_rows(
+                        mm,
+                        &mut self.counts.iter().map(|(&hash, &count)| (hash, count)),
+                    )
+                })?;
+            }
+            return Vec::<(u64, u64)>::new().into_py_any(py); // Return empty list to Python
         }
-        // If both sortcounts and sortkeys are false, no sorting is done.
 
-        // If a file is provided, write to the file
-        if let Some(filepath) = file {
-            let f = File::create(filepath)?;
-            let mut writer = BufWriter::new(f);
+        // Collect hashes and counts, sorted as requested.
+        let hash_count_pairs: Vec<(u64, u32)> = if sortkeys {
+            // Sort the bare key column, then gather counts afterwards:
+            // the sort moves half the bytes a (hash, count) sort would,
+            // and identity-hashed lookups make the gather a linear scan.
+            let mut keys: Vec<u64> = self.counts.keys().copied().collect();
+            keys.sort_unstable();
+            keys.into_iter()
+                .map(|hash| (hash, self.counts[&hash]))
+                .collect()
+        } else if sortcounts {
+            // Sort by count with hash as tiebreak. Packing both into one
+            // u128 (count in the high half) turns the two-field lexicographic
+            // compare into a single branchless integer compare.
+            let mut packed: Vec<u128> = self
+                .counts
+                .iter()
+                .map(|(&hash, &count)| (u128::from(count) << 64) | u128::from(hash))
+                .collect();
+            packed.sort_unstable();
+            packed
+                .into_iter()
+                .map(|p| (p as u64, (p >> 64) as u32))
+                .collect()
+        } else {
+            // Neither flag set: no sorting is done.
+            self.counts
+                .iter()
+                .map(|(&hash, &count)| (hash, count))
+                .collect()
+        };
 
-            // Write each hash:count pair to the file
+        if as_arrays {
+            // Split into parallel columns and hand each to numpy in one
+            // allocation + memcpy, instead of building N Python tuples.
+            let mut hashes: Vec<u64> = Vec::with_capacity(hash_count_pairs.len());
+            let mut counts: Vec<u64> = Vec::with_capacity(hash_count_pairs.len());
             for (hash, count) in hash_count_pairs {
-                writeln!(writer, "{}\t{}", hash, count)?;
+                hashes.push(hash);
+                counts.push(u64::from(count));
             }
-
-            writer.flush()?; // Flush the buffer
-            Ok(vec![]) // Return empty vector to Python
+            (
+                PyArray1::from_vec(py, hashes),
+                PyArray1::from_vec(py, counts),
+            )
+                .into_py_any(py)
         } else {
-            // Convert the vector of references to owned values
+            // Widen counts for the Python-facing return type
             let result: Vec<(u64, u64)> = hash_count_pairs
                 .into_iter()
-                .map(|(&hash, &count)| (hash, count))
+                .map(|(hash, count)| (hash, u64::from(count)))
                 .collect();
 
-            // Return the vector of (hash, count) tuples
-            Ok(result)
+            // Return the list of (hash, count) tuples
+            result.into_py_any(py)
         }
     }
 
@@ -402,25 +934,38 @@ impl KmerCountTable {
             ));
         }
 
-        // Collect canonical k-mers and their counts, skipping those not found in the counts table
-        let mut kmer_count_pairs: Vec<(&String, &u64)> = self
-            .hash_to_kmer
-            .as_ref()
-            .unwrap()
-            .par_iter() // Use rayon for parallel iteration
-            .filter_map(|(&hash, kmer)| {
-                // Use filter_map to only include (kmer, count) pairs where the count exists
-                self.counts.get(&hash).map(|count| (kmer, count))
-            })
-            .collect();
+        // Collect canonical k-mers and their counts, skipping those not
+        // found in the counts table. Packed k-mers are decoded into owned
+        // strings here; stored strings stay borrowed, so sorting and file
+        // output never copy them and only the Python return path clones.
+        let mut kmer_count_pairs: Vec<(Cow<'_, str>, u32)> =
+            match self.hash_to_kmer.as_ref().unwrap() {
+                KmerMap::Packed { ksize, map } => map
+                    .par_iter() // Use rayon for parallel iteration
+                    .filter_map(|(&hash, &packed)| {
+                        self.counts
+                            .get(&hash)
+                            .map(|&count| (Cow::Owned(unpack_kmer_2bit(packed, *ksize)), count))
+                    })
+                    .collect(),
+                KmerMap::Strings(map) => map
+                    .par_iter()
+                    .filter_map(|(&hash, kmer)| {
+                        self.counts
+                            .get(&hash)
+                            .map(|&count| (Cow::Borrowed(kmer.as_str()), count))
+                    })
+                    .collect(),
+            };
 
         // Handle sorting based on the flags
         if sortkeys {
-            // Sort by canonical kmer lexicographically
-            kmer_count_pairs.par_sort_by_key(|&(kmer, _)| kmer.clone());
+            // Sort by canonical kmer lexicographically; kmers are unique,
+            // so an unstable sort gives a deterministic order.
+            kmer_count_pairs.par_sort_unstable_by(|(kmer1, _), (kmer2, _)| kmer1.cmp(kmer2));
         } else if sortcounts {
             // Sort by count, secondary sort by kmer
-            kmer_count_pairs.par_sort_by(|&(kmer1, count1), &(kmer2, count2)| {
+            kmer_count_pairs.par_sort_unstable_by(|(kmer1, count1), (kmer2, count2)| {
                 count1.cmp(count2).then_with(|| kmer1.cmp(kmer2))
             });
         }
@@ -428,21 +973,26 @@ impl KmerCountTable {
 
         // If a file is provided, write to the file
         if let Some(filepath) = file {
-            let f = File::create(filepath)?;
-            let mut writer = BufWriter::new(f);
-
-            // Write each kmer:count pair to the file
-            for (kmer, count) in kmer_count_pairs {
-                writeln!(writer, "{}\t{}", kmer, count)?;
-            }
-
-            writer.flush()?; // Ensure all data is written to the file
+            // Rows are ksize bases, a tab, at most 10 count digits and a
+            // newline; format them straight into a file mapping and
+            // truncate to the written length.
+            let max_line = self.ksize as usize + 1 + 10 + 1;
+            write_mapped(&filepath, kmer_count_pairs.len() * max_line, |mm| {
+                let mut int_buf = itoa::Buffer::new();
+                let mut pos = 0;
+                for (kmer, count) in &kmer_count_pairs {
+                    pos += write_field(mm, pos, kmer.as_bytes(), b'\t');
+                    pos += write_field(mm, pos, int_buf.format(*count).as_bytes(), b'\n');
+                }
+                pos
+            })?;
             Ok(vec![]) // Return an empty vector when writing to a file
         } else {
-            // Convert the vector of references to owned values
+            // Widen counts and take ownership for the Python-facing return
+            // type; borrowed k-mers are copied only here.
             let result: Vec<(String, u64)> = kmer_count_pairs
                 .into_par_iter() // Use rayon for parallel conversion
-                .map(|(kmer, &count)| (kmer.clone(), count))
+                .map(|(kmer, count)| (kmer.into_owned(), u64::from(count)))
                 .collect();
 
             // Return the vector of (kmer, count) tuples
@@ -458,61 +1008,76 @@ impl KmerCountTable {
     /// even if no k-mers were observed for those frequencies.
     #[pyo3(signature = (zero=true))]
     pub fn histo(&self, zero: bool) -> Vec<(u64, u64)> {
-        let mut freq_count: HashMap<u64, u64> = HashMap::new();
-
-        // Step 1: Count the frequencies of observed k-mer counts
-        for &count in self.counts.values() {
-            *freq_count.entry(count).or_insert(0) += 1;
-        }
-
-        let mut histo_vec: Vec<(u64, u64)>;
+        // Single-pass bincount: k-mer counts are usually small integers,
+        // so a dense Vec indexed by count replaces the intermediate hash
+        // map and comes out in frequency order for free. With `zero` set
+        // the result spans every frequency up to max anyway, so the bins
+        // cost no more than the output; otherwise only use them while
+        // they stay proportional to the table, since a single
+        // high-abundance k-mer would otherwise force 8*max bytes of bins
+        // for a sparse histogram.
+        let max_count = self.max();
+        let dense = zero || max_count / 2 <= self.counts.len() as u64;
+
+        if dense {
+            let mut bins = vec![0u64; max_count as usize + 1];
+            for &count in self.counts.values() {
+                bins[count as usize] += 1;
+            }
 
-        if zero {
-            // Step 2 (optional): Include all frequencies from 0 to max_count
-            let max_count = self.max();
-            histo_vec = (0..=max_count)
-                .map(|freq| (freq, *freq_count.get(&freq).unwrap_or(&0)))
-                .collect();
+            if zero {
+                // Include every frequency from 0 to max_count.
+                bins.into_iter()
+                    .enumerate()
+                    .map(|(freq, n)| (freq as u64, n))
+                    .collect()
+            } else {
+                // Only include observed frequencies.
+                bins.into_iter()
+                    .enumerate()
+                    .filter(|&(_, n)| n != 0)
+                    .map(|(freq, n)| (freq as u64, n))
+                    .collect()
+            }
         } else {
-            // Step 2: Only include observed frequencies
-            histo_vec = freq_count.into_iter().collect();
-            histo_vec.sort_by_key(|&(frequency, _)| frequency);
+            // Sparse tally, sized by distinct frequencies; the BTreeMap
+            // keeps the frequency order the dense path gets for free.
+            let mut tally: BTreeMap<u32, u64> = BTreeMap::new();
+            for &count in self.counts.values() {
+                *tally.entry(count).or_insert(0) += 1;
+            }
+            tally
+                .into_iter()
+                .map(|(freq, n)| (u64::from(freq), n))
+                .collect()
         }
-
-        histo_vec
     }
 
     /// Finds and returns the minimum count in the counts HashMap.
     /// Returns 0 if the HashMap is empty.
     #[getter]
     pub fn min(&self) -> u64 {
-        // Check if the HashMap is empty, return 0 if true
-        if self.counts.is_empty() {
-            return 0;
-        }
-
-        // Iterate over the counts and find the minimum value
-        *self.counts.values().min().unwrap_or(&0)
+        // Served from the cache; one value scan after any mutation.
+        self.refresh_minmax();
+        self.min_cache.load(Ordering::Relaxed)
     }
 
     /// Finds and returns the maximum count in the counts HashMap.
     /// Returns 0 if the HashMap is empty.
     #[getter]
     pub fn max(&self) -> u64 {
-        // Check if the HashMap is empty, return 0 if true
-        if self.counts.is_empty() {
-            return 0;
-        }
-
-        // Iterate over the counts and find the maximum value
-        *self.counts.values().max().unwrap_or(&0)
+        // Served from the cache; one value scan after any mutation.
+        self.refresh_minmax();
+        self.max_cache.load(Ordering::Relaxed)
     }
 
-    // Getter for the 'hashes' attribute, returning all hash keys in the table
+    // Getter for the 'hashes' attribute, returning all hash keys in the
+    // table as a numpy uint64 array: one gather pass and one buffer
+    // allocation instead of a boxed Python int per key.
     #[getter]
-    pub fn hashes(&self) -> Vec<u64> {
-        // Collect and return all keys from the counts HashMap
-        self.counts.keys().cloned().collect()
+    pub fn hashes<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<u64>> {
+        let keys: Vec<u64> = self.counts.keys().copied().collect();
+        PyArray1::from_vec(py, keys)
     }
 
     // Attribute to access the version of oxli that the table was created with
@@ -530,104 +1095,208 @@ impl KmerCountTable {
     // Getter for the sum of all counts in the table.
     #[getter]
     pub fn sum_counts(&self) -> u64 {
-        self.counts.values().sum()
+        self.counts.values().map(|&count| u64::from(count)).sum()
     }
 
     // Consume this DNA string. Return total number of k-mers consumed.
+    // Accepts either str or a bytes-like object; bytes skip the UTF-8
+    // conversion entirely for bulk loading.
     // If "skip_bad_kmers = true" then ignore kmers with non-DNA characters
     // else if "false" consume kmers until a bad kmer in encountered, then
     // exit with error.
     #[pyo3(signature = (seq, skip_bad_kmers=true))]
-    pub fn consume(&mut self, seq: &str, skip_bad_kmers: bool) -> PyResult<u64> {
-        // Incoming seq len
-        let new_len = seq.len();
-        // Init tally for consumed kmers
-        let mut n = 0;
-        // If store_kmers is true, then count & log hash:kmer pairs
-        if self.store_kmers {
-            let hash_to_kmer = self.hash_to_kmer.as_mut().unwrap();
+    pub fn consume(&mut self, seq: &Bound<'_, PyAny>, skip_bad_kmers: bool) -> PyResult<u64> {
+        let py = seq.py();
+        // Prefer raw bytes: no UTF-8 validation pass on the sequence.
+        // The hot loop runs with the GIL released so other Python threads
+        // can make progress (and rayon workers are not starved).
+        if let Ok(bytes) = seq.downcast::<PyBytes>() {
+            let data = bytes.as_bytes();
+            py.allow_threads(|| self.consume_impl(data, skip_bad_kmers))
+        } else {
+            let s: &str = seq.extract()?;
+            py.allow_threads(|| self.consume_impl(s.as_bytes(), skip_bad_kmers))
+        }
+    }
 
-            // Create an iterator for (canonical_kmer, hash) pairs
-            let iter = KmersAndHashesIter::new(seq, self.ksize as usize, skip_bad_kmers);
+    /// Consume a batch of sequences in a single call, amortizing the
+    /// per-call overhead of consume. Returns the total number of k-mers
+    /// counted across all sequences.
+    #[pyo3(signature = (seqs, skip_bad_kmers=true))]
+    pub fn consume_batch(
+        &mut self,
+        py: Python<'_>,
+        seqs: Vec<String>,
+        skip_bad_kmers: bool,
+    ) -> PyResult<u64> {
+        py.allow_threads(|| {
+            // Without stored k-mer strings each sequence hashes into an
+            // independent batch, so rayon can hash all of them in parallel
+            // and the batches fold into the table in one bulk merge.
+            if !self.store_kmers && skip_bad_kmers {
+                let partials: PyResult<Vec<Vec<u64>>> = seqs
+                    .par_iter()
+                    .map(|seq| hash_sequence(seq.as_bytes(), self.ksize as usize))
+                    .collect();
+                let partials = partials?;
+
+                self.consumed += seqs.iter().map(|seq| seq.len() as u64).sum::<u64>();
+
+                let total: usize = partials.iter().map(Vec::len).sum();
+                let mut all_hashes: Vec<u64> = Vec::with_capacity(total);
+                for hashvals in partials {
+                    all_hashes.extend_from_slice(&hashvals);
+                }
+                return if all_hashes.len() >= 16 * (self.counts.len() + 1) {
+                    Ok(self.merge_hashes_sorted(all_hashes))
+                } else {
+                    Ok(self.count_hashes(all_hashes))
+                };
+            }
 
-            // Iterate over the k-mers and their hashes
-            for result in iter {
-                match result {
-                    Ok((kmer, hash)) => {
-                        if hash != 0 {
-                            // Insert hash:kmer pair into the hashmap
-                            hash_to_kmer.insert(hash, kmer.clone());
-                            // Increment the count for the hash
-                            *self.counts.entry(hash).or_insert(0) += 1;
-                            // Tally kmers added
-                            n += 1;
-                        }
+            let mut total: u64 = 0;
+            for seq in &seqs {
+                total += self.consume_impl(seq.as_bytes(), skip_bad_kmers)?;
+            }
+            Ok(total)
+        })
+    }
+
+    /// Count all k-mers from the sequences in a FASTA file.
+    /// Returns the total number of k-mers counted.
+    // The file is memory-mapped rather than read into an intermediate
+    // Python string, so bulk loading is bounded by hashing rather than
+    // by copies; the OS page cache backs the sequence data directly.
+    #[pyo3(signature = (path, skip_bad_kmers=true))]
+    pub fn consume_file(
+        &mut self,
+        py: Python<'_>,
+        path: String,
+        skip_bad_kmers: bool,
+    ) -> PyResult<u64> {
+        let file = File::open(&path)?;
+        let mmap = unsafe { Mmap::map(&file)? };
+
+        py.allow_threads(|| {
+            let mut total: u64 = 0;
+            // Sequence lines of the current record, with newlines stripped.
+            let mut record: Vec<u8> = Vec::new();
+
+            for line in mmap.split(|&b| b == b'\n') {
+                let line = line.strip_suffix(b"\r").unwrap_or(line);
+                if line.first() == Some(&b'>') {
+                    // Header line: finish the previous record, if any.
+                    if !record.is_empty() {
+                        total += self.consume_impl(&record, skip_bad_kmers)?;
+                        record.clear();
                     }
-                    Err(e) => return Err(e),
+                } else {
+                    record.extend_from_slice(line);
                 }
             }
-        } else {
-            // Else, hash and count kmers as usual
-            let hashes = SeqToHashes::new(
-                seq.as_bytes(),
-                self.ksize.into(),
-                skip_bad_kmers,
-                false,
-                HashFunctions::Murmur64Dna,
-                42,
-            );
+            if !record.is_empty() {
+                total += self.consume_impl(&record, skip_bad_kmers)?;
+            }
 
-            for hash_value in hashes {
-                // eprintln!("hash_value: {:?}", hash_value);
-                match hash_value {
-                    Ok(0) => continue,
-                    Ok(x) => {
-                        self.count_hash(x);
+            Ok(total)
+        })
+    }
+
+    /// Merge all counts from another KmerCountTable into this one.
+    /// Returns the number of new hash keys added to this table.
+    pub fn add(&mut self, py: Python<'_>, other: &KmerCountTable) -> PyResult<u64> {
+        // Tables must agree on k-mer size for hashes to be comparable
+        if self.ksize != other.ksize {
+            return Err(PyValueError::new_err(
+                "cannot add tables with different ksize",
+            ));
+        }
+
+        // The merge loop touches no Python objects, so run it with the
+        // GIL released.
+        self.touch_counts();
+        py.allow_threads(|| {
+            // Reserve destination capacity once so the merge never rehashes
+            // mid-loop; new_keys stays a local so it can live in a register.
+            self.counts.reserve(other.counts.len());
+            let mut new_keys: u64 = 0;
+
+            for (&hash, &count) in other.counts.iter() {
+                match self.counts.entry(hash) {
+                    Entry::Occupied(mut entry) => {
+                        *entry.get_mut() = entry.get().saturating_add(count);
                     }
-                    Err(_) => {
-                        let msg = format!("bad k-mer encountered at position {}", n);
-                        return Err(PyValueError::new_err(msg));
+                    Entry::Vacant(entry) => {
+                        entry.insert(count);
+                        new_keys += 1;
                     }
                 }
+            }
 
-                n += 1;
+            // Carry over stored hash:kmer pairs when both tables track them
+            if self.store_kmers && other.store_kmers {
+                self.hash_to_kmer
+                    .as_mut()
+                    .unwrap()
+                    .merge(other.hash_to_kmer.as_ref().unwrap());
             }
-        }
 
-        // Update the total sequence consumed tracker
-        self.consumed += new_len as u64;
+            // Merged tables have consumed the combined sequence length
+            self.consumed += other.consumed;
 
-        Ok(n)
+            Ok(new_keys)
+        })
     }
 
     // Helper method to get hash set of k-mers
     fn hash_set(&self) -> HashSet<u64> {
-        self.counts.keys().cloned().collect()
+        self.counts.keys().copied().collect()
     }
 
-    // Set operation methods
+    // Set operation methods. Each result is assembled directly from the
+    // two counts maps, whose identity-hashed lookups serve as the
+    // membership tests; no intermediate per-table HashSet is built.
     pub fn union(&self, other: &KmerCountTable) -> HashSet<u64> {
-        self.hash_set().union(&other.hash_set()).cloned().collect()
+        let mut result: HashSet<u64> =
+            HashSet::with_capacity(self.counts.len() + other.counts.len());
+        result.extend(self.counts.keys().copied());
+        result.extend(other.counts.keys().copied());
+        result
     }
 
     pub fn intersection(&self, other: &KmerCountTable) -> HashSet<u64> {
-        self.hash_set()
-            .intersection(&other.hash_set())
-            .cloned()
+        // Probe the larger table with the smaller one's keys.
+        let (small, large) = if self.counts.len() <= other.counts.len() {
+            (&self.counts, &other.counts)
+        } else {
+            (&other.counts, &self.counts)
+        };
+        small
+            .keys()
+            .filter(|hash| large.contains_key(hash))
+            .copied()
             .collect()
     }
 
     pub fn difference(&self, other: &KmerCountTable) -> HashSet<u64> {
-        self.hash_set()
-            .difference(&other.hash_set())
-            .cloned()
+        self.counts
+            .keys()
+            .filter(|hash| !other.counts.contains_key(hash))
+            .copied()
             .collect()
     }
 
     pub fn symmetric_difference(&self, other: &KmerCountTable) -> HashSet<u64> {
-        self.hash_set()
-            .symmetric_difference(&other.hash_set())
-            .cloned()
+        self.counts
+            .keys()
+            .filter(|hash| !other.counts.contains_key(hash))
+            .chain(
+                other
+                    .counts
+                    .keys()
+                    .filter(|hash| !self.counts.contains_key(hash)),
+            )
+            .copied()
             .collect()
     }
 
@@ -650,8 +1319,16 @@ impl KmerCountTable {
 
     // Python __iter__ method to return an iterator
     pub fn __iter__(slf: PyRef<Self>) -> KmerCountTableIterator {
+        // Snapshot into a flat Vec rather than cloning the whole HashMap:
+        // a clone rebuilds the table structure, while a Vec collect is a
+        // single linear pass and preserves the map's iteration order.
         KmerCountTableIterator {
-            inner: slf.counts.clone().into_iter(), // Clone the HashMap and convert to iterator
+            inner: slf
+                .counts
+                .iter()
+                .map(|(&hash, &count)| (hash, count))
+                .collect::<Vec<_>>()
+                .into_iter(),
         }
     }
 
@@ -661,12 +1338,13 @@ impl KmerCountTable {
     }
 
     // Python dunder method for __getitem__
-    fn __getitem__(&self, kmer: String) -> PyResult<u64> {
+    fn __getitem__(&self, kmer: &str) -> PyResult<u64> {
         self.get(kmer)
     }
 
     // Python dunder method for __setitem__
-    pub fn __setitem__(&mut self, kmer: String, count: u64) -> PyResult<()> {
+    pub fn __setitem__(&mut self, kmer: &str, count: u32) -> PyResult<()> {
+        self.touch_counts();
         // Calculate the hash for the k-mer
         let hashval = self.hash_kmer(kmer)?;
         // Set the count for the k-mer
@@ -680,7 +1358,10 @@ impl KmerCountTable {
         seq: &str,
         skip_bad_kmers: bool,
     ) -> PyResult<Vec<(String, u64)>> {
-        let mut v: Vec<(String, u64)> = vec![];
+        // Pre-size for one entry per k-mer window, the exact count unless
+        // bad k-mers are skipped.
+        let n_kmers = seq.len().saturating_sub(self.ksize as usize) + 1;
+        let mut v: Vec<(String, u64)> = Vec::with_capacity(n_kmers);
 
         // Create the iterator
         let iter = KmersAndHashesIter::new(seq, self.ksize as usize, skip_bad_kmers);
@@ -696,6 +1377,17 @@ impl KmerCountTable {
         Ok(v)
     }
 
+    /// Lazily yield (canonical_kmer, hash) pairs for a sequence. Unlike
+    /// kmers_and_hashes, no list of every window is materialized; each
+    /// pair is built when the Python iterator asks for it, keeping memory
+    /// flat on long sequences.
+    #[pyo3(signature = (seq, skip_bad_kmers=true))]
+    pub fn kmers_and_hashes_iter(&self, seq: &str, skip_bad_kmers: bool) -> KmersAndHashesPyIter {
+        KmersAndHashesPyIter {
+            inner: KmersAndHashesIter::new(seq, self.ksize as usize, skip_bad_kmers),
+        }
+    }
+
     /// Calculates the Jaccard Similarity Coefficient between two KmerCountTable objects.
     /// # Returns
     /// The Jaccard Similarity Coefficient between the two tables as a float value between 0 and 1.
@@ -724,13 +1416,21 @@ impl KmerCountTable {
             return 0.0;
         }
 
-        // Calculate the dot product in parallel.
-        let dot_product: u64 = self
-            .counts
+        // Calculate the dot product in parallel, walking the smaller table
+        // and probing the larger: the product is symmetric and this caps
+        // the number of random lookups at the smaller key count.
+        let (small, large) = if self.counts.len() <= other.counts.len() {
+            (&self.counts, &other.counts)
+        } else {
+            (&other.counts, &self.counts)
+        };
+        let dot_product: u64 = small
             .par_iter()
             .filter_map(|(&hash, &count1)| {
                 // Only include in the dot product if both tables have the k-mer.
-                other.counts.get(&hash).map(|&count2| count1 * count2)
+                large
+                    .get(&hash)
+                    .map(|&count2| u64::from(count1) * u64::from(count2))
             })
             .sum();
 
@@ -759,15 +1459,418 @@ impl KmerCountTable {
     }
 }
 
+impl KmerCountTable {
+    /// Write the table in the framed binary format: magic, header fields,
+    /// then contiguous little-endian slabs of hashes and counts (and the
+    /// stored k-mer map, when present).
+    fn write_binary<W: Write>(&self, writer: &mut W) -> std::io::Result<()> {
+        writer.write_all(BINARY_MAGIC)?;
+        writer.write_all(&[self.ksize, self.store_kmers as u8])?;
+        writer.write_all(&self.consumed.to_le_bytes())?;
+        let version = self.version.as_bytes();
+        writer.write_all(&(version.len() as u32).to_le_bytes())?;
+        writer.write_all(version)?;
+
+        // Hash and count slabs, gathered in one map pass: counts are
+        // buffered while hashes stream out, so both slabs share the map's
+        // iteration order.
+        writer.write_all(&(self.counts.len() as u64).to_le_bytes())?;
+        let mut counts_slab: Vec<u8> = Vec::with_capacity(self.counts.len() * 4);
+        for (&hash, &count) in self.counts.iter() {
+            writer.write_all(&hash.to_le_bytes())?;
+            counts_slab.extend_from_slice(&count.to_le_bytes());
+        }
+        writer.write_all(&counts_slab)?;
+
+        if self.store_kmers {
+            match self.hash_to_kmer.as_ref().unwrap() {
+                KmerMap::Packed { ksize: _, map } => {
+                    writer.write_all(&[0u8])?;
+                    writer.write_all(&(map.len() as u64).to_le_bytes())?;
+                    let mut packed_slab: Vec<u8> = Vec::with_capacity(map.len() * 8);
+                    for (&hash, &packed) in map.iter() {
+                        writer.write_all(&hash.to_le_bytes())?;
+                        packed_slab.extend_from_slice(&packed.to_le_bytes());
+                    }
+                    writer.write_all(&packed_slab)?;
+                }
+                KmerMap::Strings(map) => {
+                    // Canonical k-mers all have length ksize, so the
+                    // string slab needs no per-entry length prefixes.
+                    writer.write_all(&[1u8])?;
+                    writer.write_all(&(map.len() as u64).to_le_bytes())?;
+                    let mut kmer_slab: Vec<u8> =
+                        Vec::with_capacity(map.len() * self.ksize as usize);
+                    for (&hash, kmer) in map.iter() {
+                        writer.write_all(&hash.to_le_bytes())?;
+                        kmer_slab.extend_from_slice(kmer.as_bytes());
+                    }
+                    writer.write_all(&kmer_slab)?;
+                }
+            }
+        }
+        Ok(())
+    }
+
+    /// Parse a table from the framed binary format produced by
+    /// `write_binary`. `data` covers the whole file including the magic.
+    fn read_binary(data: &[u8]) -> Result<KmerCountTable> {
+        let mut reader = SlabReader {
+            data,
+            pos: BINARY_MAGIC.len(),
+        };
+
+        let ksize = reader.u8()?;
+        let store_kmers = reader.u8()? != 0;
+        let consumed = reader.u64()?;
+        let version_len = reader.u32()? as usize;
+        let version = String::from_utf8(reader.bytes(version_len)?.to_vec())
+            .map_err(|e| anyhow!("Deserialization error: {}", e))?;
+
+        let n = reader.u64()? as usize;
+        let hash_slab = reader.slab(n, 8)?;
+        let count_slab = reader.slab(n, 4)?;
+        let mut counts = CountMap::with_capacity_and_hasher(n, BuildNoHashHasher::default());
+        for (hash, count) in hash_slab
+            .chunks_exact(8)
+            .map(|b| u64::from_le_bytes(b.try_into().unwrap()))
+            .zip(
+                count_slab
+                    .chunks_exact(4)
+                    .map(|b| u32::from_le_bytes(b.try_into().unwrap())),
+            )
+        {
+            counts.insert(hash, count);
+        }
+
+        let hash_to_kmer = if store_kmers {
+            let tag = reader.u8()?;
+            let n2 = reader.u64()? as usize;
+            let hashes = reader.slab(n2, 8)?;
+            let hashes = hashes
+                .chunks_exact(8)
+                .map(|b| u64::from_le_bytes(b.try_into().unwrap()));
+            Some(match tag {
+                0 => {
+                    let packed_slab = reader.slab(n2, 8)?;
+                    let mut map: HashMap<u64, u64, BuildNoHashHasher<u64>> = HashMap::default();
+                    map.reserve(n2);
+                    for (hash, packed) in hashes.zip(
+                        packed_slab
+                            .chunks_exact(8)
+                            .map(|b| u64::from_le_bytes(b.try_into().unwrap())),
+                    ) {
+                        map.insert(hash, packed);
+                    }
+                    KmerMap::Packed {
+                        ksize: ksize as usize,
+                        map,
+                    }
+                }
+                1 => {
+                    if ksize == 0 {
+                        return Err(anyhow!("Deserialization error: zero ksize"));
+                    }
+                    let kmer_slab = reader.slab(n2, ksize as usize)?;
+                    let mut map = StringKmerMap::default();
+                    map.reserve(n2);
+                    for (hash, kmer) in hashes.zip(kmer_slab.chunks_exact(ksize as usize)) {
+                        let kmer = std::str::from_utf8(kmer)
+                            .map_err(|e| anyhow!("Deserialization error: {}", e))?;
+                        map.insert(hash, kmer.to_string());
+                    }
+                    KmerMap::Strings(map)
+                }
+                _ => {
+                    return Err(anyhow!(
+                        "Deserialization error: unknown kmer map tag {}",
+                        tag
+                    ))
+                }
+            })
+        } else {
+            None
+        };
+
+        Ok(KmerCountTable {
+            counts,
+            ksize,
+            version,
+            consumed,
+            store_kmers,
+            hash_to_kmer,
+            minmax_dirty: dirty_cache(),
+            min_cache: AtomicU64::new(0),
+            max_cache: AtomicU64::new(0),
+        })
+    }
+
+    /// Mark the min/max caches stale; called from every mutating path.
+    #[inline]
+    fn touch_counts(&self) {
+        self.minmax_dirty.store(true, Ordering::Relaxed);
+    }
+
+    /// Recompute the min/max caches in one pass if they are stale.
+    fn refresh_minmax(&self) {
+        if self.minmax_dirty.swap(false, Ordering::Relaxed) {
+            let mut lo = u32::MAX;
+            let mut hi = 0u32;
+            for &count in self.counts.values() {
+                lo = lo.min(count);
+                hi = hi.max(count);
+            }
+            if self.counts.is_empty() {
+                lo = 0;
+            }
+            self.min_cache.store(u64::from(lo), Ordering::Relaxed);
+            self.max_cache.store(u64::from(hi), Ordering::Relaxed);
+        }
+    }
+
+    /// Hash a borrowed k-mer without copying it into an owned String.
+    fn hash_kmer_bytes(&self, kmer: &[u8]) -> Result<u64> {
+        if kmer.len() as u8 != self.ksize {
+            Err(anyhow!("wrong ksize"))
+        } else {
+            let mut hashes = SeqToHashes::new(
+                kmer,
+                self.ksize.into(),
+                false,
+                false,
+                HashFunctions::Murmur64Dna,
+                42,
+            );
+
+            let hashval = hashes.next().expect("error hashing this k-mer");
+            Ok(hashval?)
+        }
+    }
+
+    /// Shared consume implementation over raw sequence bytes.
+    fn consume_impl(&mut self, seq: &[u8], skip_bad_kmers: bool) -> PyResult<u64> {
+        self.touch_counts();
+        // Incoming seq len
+        let new_len = seq.len();
+        // Init tally for consumed kmers
+        let n;
+        // If store_kmers is true, then count & log hash:kmer pairs
+        if self.store_kmers {
+            let seq_str = std::str::from_utf8(seq)
+                .map_err(|_| PyValueError::new_err("sequence is not valid UTF-8"))?;
+            let hash_to_kmer = self.hash_to_kmer.as_mut().unwrap();
+            let mut stored = 0;
+
+            // Create an iterator for (canonical_kmer, hash) pairs
+            let iter = KmersAndHashesIter::new(seq_str, self.ksize as usize, skip_bad_kmers);
+
+            // Iterate over the k-mers and their hashes
+            for result in iter {
+                match result {
+                    Ok((kmer, hash)) => {
+                        if hash != 0 {
+                            // Insert hash:kmer pair into the hashmap
+                            hash_to_kmer.insert_if_absent(hash, &kmer);
+                            // Increment the count for the hash
+                            let count = self.counts.entry(hash).or_insert(0);
+                            *count = count.saturating_add(1);
+                            // Tally kmers added
+                            stored += 1;
+                        }
+                    }
+                    Err(e) => return Err(e),
+                }
+            }
+            n = stored;
+        } else if new_len >= PARALLEL_SEQ_THRESHOLD && skip_bad_kmers {
+            // Long sequences: hash chunks in parallel, then merge. Counts
+            // are order-independent, so results match the serial path.
+            n = self.consume_parallel(seq)?;
+        } else {
+            // Else, hash and count kmers as usual
+            let hashes = SeqToHashes::new(
+                seq,
+                self.ksize.into(),
+                skip_bad_kmers,
+                false,
+                HashFunctions::Murmur64Dna,
+                42,
+            );
+
+            // Collect the hash stream into a pre-sized buffer first, so the
+            // hashing pass runs as a straight sequential scan and the counting
+            // pass becomes one tight loop over the table.
+            let max_kmers = new_len.saturating_sub(self.ksize as usize) + 1;
+            let mut hashvals: Vec<u64> = Vec::with_capacity(max_kmers);
+
+            for hash_value in hashes {
+                // eprintln!("hash_value: {:?}", hash_value);
+                match hash_value {
+                    Ok(0) => continue,
+                    Ok(x) => {
+                        hashvals.push(x);
+                    }
+                    Err(_) => {
+                        let msg = format!("bad k-mer encountered at position {}", hashvals.len());
+                        return Err(PyValueError::new_err(msg));
+                    }
+                }
+            }
+
+            // Count the collected hashes in a single bulk pass.
+            n = self.count_hashes(hashvals);
+        }
+
+        // Update the total sequence consumed tracker
+        self.consumed += new_len as u64;
+
+        Ok(n)
+    }
+
+    /// Hash a long sequence with rayon over overlapping windows and merge
+    /// the per-chunk hash batches into the counts table.
+    fn consume_parallel(&mut self, seq: &[u8]) -> PyResult<u64> {
+        let ksize = self.ksize as usize;
+        if seq.len() < ksize {
+            return Ok(0);
+        }
+
+        // Each window covers `chunk` k-mer start positions; windows extend
+        // k-1 bases past their end so no boundary k-mer is lost.
+        let n_kmers = seq.len() - ksize + 1;
+        let chunk = n_kmers.div_ceil(rayon::current_num_threads()).max(1);
+        let starts: Vec<usize> = (0..n_kmers).step_by(chunk).collect();
+
+        let partials: PyResult<Vec<Vec<u64>>> = starts
+            .into_par_iter()
+            .map(|start| {
+                let end = (start + chunk + ksize - 1).min(seq.len());
+                let hashes = SeqToHashes::new(
+                    &seq[start..end],
+                    ksize,
+                    true, // bad k-mers hash to 0 and are skipped
+                    false,
+                    HashFunctions::Murmur64Dna,
+                    42,
+                );
+
+                let mut hashvals: Vec<u64> = Vec::with_capacity(end - start - ksize + 1);
+                for hash_value in hashes {
+                    match hash_value {
+                        Ok(0) => continue,
+                        Ok(x) => hashvals.push(x),
+                        Err(_) => {
+                            let msg = format!(
+                                "bad k-mer encountered at position {}",
+                                start + hashvals.len()
+                            );
+                            return Err(PyValueError::new_err(msg));
+                        }
+                    }
+                }
+                Ok(hashvals)
+            })
+            .collect();
+
+        let partials = partials?;
+        let total: usize = partials.iter().map(|hashvals| hashvals.len()).sum();
+        let mut all_hashes: Vec<u64> = Vec::with_capacity(total);
+        for hashvals in partials {
+            all_hashes.extend_from_slice(&hashvals);
+        }
+
+        // When the batch dwarfs the existing table, most increments hit a
+        // small set of distinct hashes: sort-and-compress into (hash, run)
+        // pairs first so the table sees one probe per distinct hash.
+        if all_hashes.len() >= 16 * (self.counts.len() + 1) {
+            Ok(self.merge_hashes_sorted(all_hashes))
+        } else {
+            Ok(self.count_hashes(all_hashes))
+        }
+    }
+
+    /// Sort a batch of hashes and merge run-length-compressed (hash, run)
+    /// pairs into the counts table. Returns the number of hashes merged.
+    fn merge_hashes_sorted(&mut self, mut hashvals: Vec<u64>) -> u64 {
+        self.touch_counts();
+        let n = hashvals.len() as u64;
+        hashvals.par_sort_unstable();
+
+        // Run-length compress shards of the sorted batch in parallel.
+        // Shard boundaries are pushed forward to the next change of value,
+        // so every run lands in exactly one shard and the remaining serial
+        // work is a single table insert per distinct hash.
+        let shards = rayon::current_num_threads().max(1);
+        let shard_len = hashvals.len().div_ceil(shards).max(1);
+        let runs: Vec<Vec<(u64, u32)>> = (0..hashvals.len())
+            .step_by(shard_len)
+            .collect::<Vec<_>>()
+            .into_par_iter()
+            .map(|shard_start| {
+                let stop = (shard_start + shard_len).min(hashvals.len());
+                let mut start = shard_start;
+                while start > 0 && hashvals[start] == hashvals[start - 1] {
+                    start += 1;
+                    if start == hashvals.len() {
+                        return vec![];
+                    }
+                }
+
+                let mut compressed = Vec::new();
+                let mut i = start;
+                while i < stop {
+                    let hash = hashvals[i];
+                    let mut run = 1;
+                    // Runs may extend past `stop`; the owning shard counts
+                    // the whole run and the next shard skips it.
+                    while i + run < hashvals.len() && hashvals[i + run] == hash {
+                        run += 1;
+                    }
+                    compressed.push((hash, run as u32));
+                    i += run;
+                }
+                compressed
+            })
+            .collect();
+
+        for shard in runs {
+            for (hash, run) in shard {
+                let count = self.counts.entry(hash).or_insert(0);
+                *count = count.saturating_add(run);
+            }
+        }
+        n
+    }
+}
+
 #[pyclass]
 /// Iterator implementation for KmerCountTable
 pub struct KmerCountTableIterator {
-    inner: IntoIter<u64, u64>, // Now we own the iterator
+    inner: std::vec::IntoIter<(u64, u32)>, // Owned snapshot of the table
 }
 
 #[pymethods]
 impl KmerCountTableIterator {
     pub fn __next__(mut slf: PyRefMut<Self>) -> Option<(u64, u64)> {
+        slf.inner
+            .next()
+            .map(|(hash, count)| (hash, u64::from(count)))
+    }
+}
+
+#[pyclass]
+/// Streaming Python iterator over (canonical_kmer, hash) pairs.
+pub struct KmersAndHashesPyIter {
+    inner: KmersAndHashesIter,
+}
+
+#[pymethods]
+impl KmersAndHashesPyIter {
+    pub fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+
+    pub fn __next__(mut slf: PyRefMut<Self>) -> Option<PyResult<(String, u64)>> {
         slf.inner.next()
     }
 }
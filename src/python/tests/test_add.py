@@ -0,0 +1,84 @@
+import pytest
+
+import oxli
+from test_basic import create_sample_kmer_table
+
+
+# Merging tables with add()
+
+
+def test_add_to_empty_table():
+    table1 = oxli.KmerCountTable(ksize=3)
+    table2 = create_sample_kmer_table(3, ["AAA", "AAC", "AAC"])
+
+    new_keys = table1.add(table2)
+
+    assert new_keys == 2, "All keys from table2 should be new"
+    assert table1.get("AAA") == 1
+    assert table1.get("AAC") == 2
+
+
+def test_add_different_content():
+    table1 = create_sample_kmer_table(3, ["AAA", "AAC"])
+    table2 = create_sample_kmer_table(3, ["AAC", "AAG"])
+
+    new_keys = table1.add(table2)
+
+    assert new_keys == 1, "Only 'AAG' should be a new key"
+    assert table1.get("AAA") == 1
+    assert table1.get("AAC") == 2, "Overlapping counts should sum"
+    assert table1.get("AAG") == 1
+
+
+def test_add_multiple_times():
+    table1 = create_sample_kmer_table(3, ["AAA"])
+    table2 = create_sample_kmer_table(3, ["AAA"])
+
+    assert table1.add(table2) == 0, "No new keys on overlapping add"
+    assert table1.add(table2) == 0
+    assert table1.get("AAA") == 3
+
+
+def test_add_different_ksize():
+    table1 = oxli.KmerCountTable(ksize=3)
+    table2 = oxli.KmerCountTable(ksize=4)
+
+    with pytest.raises(ValueError, match="different ksize"):
+        table1.add(table2)
+
+
+def test_add_updates_consumed():
+    table1 = oxli.KmerCountTable(ksize=4)
+    table2 = oxli.KmerCountTable(ksize=4)
+    table1.consume("ATCGG")
+    table2.consume("GGATC")
+
+    table1.add(table2)
+
+    assert table1.consumed == 10, "Merged table should track combined length"
+
+
+def test_add_merges_stored_kmers():
+    table1 = oxli.KmerCountTable(ksize=4, store_kmers=True)
+    table2 = oxli.KmerCountTable(ksize=4, store_kmers=True)
+    table1.count("AAAA")
+    table2.count("GGGG")
+
+    table1.add(table2)
+
+    assert table1.unhash(table1.hash_kmer("GGGG")) == "CCCC"
+
+
+def test_add_large_tables():
+    # Merge two tables built from 400 kb of sequence each
+    seq = "ATGC" * 100000
+    table1 = oxli.KmerCountTable(ksize=5)
+    table2 = oxli.KmerCountTable(ksize=5)
+    table1.consume(seq)
+    table2.consume(seq)
+
+    new_keys = table1.add(table2)
+
+    assert new_keys == 0, "Both tables contain the same k-mers"
+    assert len(table1) == len(table2)
+    assert table1.sum_counts == 2 * table2.sum_counts
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import pytest
@@ -25,6 +26,7 @@ def test_hashes_attribute():
     ), ".hashes attribute should match the expected set of hash keys"
 
 
+@functools.cache
 def get_version_from_cargo_toml():
     # Path to Cargo.toml relative to the location of the test file
     cargo_toml_path = Path(__file__).resolve().parents[3] / "Cargo.toml"
@@ -6,8 +6,7 @@ import oxli
 # Helper function, create tables.
 def create_sample_kmer_table(ksize, kmers):
     table = oxli.KmerCountTable(ksize)
-    for kmer in kmers:
-        table.count(kmer)
+    table.count_many(kmers)
     return table
 
 
@@ -32,6 +31,57 @@ def test_count_hash():
     assert cg.get_hash(hashkey) == 1
 
 
+def test_count_hashes():
+    # count a batch of hashvals in one call
+    cg = oxli.KmerCountTable(ksize=4)
+    hash_aaaa = cg.hash_kmer("AAAA")
+    hash_atcg = cg.hash_kmer("ATCG")
+
+    assert cg.count_hashes([hash_aaaa, hash_atcg, hash_aaaa]) == 3
+    assert cg.get_hash(hash_aaaa) == 2
+    assert cg.get_hash(hash_atcg) == 1
+
+
+def test_count_hashes_empty():
+    cg = oxli.KmerCountTable(ksize=4)
+    assert cg.count_hashes([]) == 0
+    assert len(cg) == 0
+
+
+def test_count_many():
+    # count a batch of kmers in one call
+    cg = oxli.KmerCountTable(ksize=4)
+
+    assert cg.count_many(["AAAA", "ATCG", "AAAA"]) == 3
+    assert cg.get("AAAA") == 2
+    assert cg.get("ATCG") == 1
+    assert cg.consumed == 12
+
+
+def test_count_many_wrong_ksize():
+    cg = oxli.KmerCountTable(ksize=4)
+
+    with pytest.raises(ValueError, match="does not match count table ksize"):
+        cg.count_many(["AAAA", "AAA"])
+
+
+def test_count_many_store_kmers():
+    cg = oxli.KmerCountTable(ksize=4, store_kmers=True)
+    cg.count_many(["GGGG"])
+
+    assert cg.unhash(cg.hash_kmer("GGGG")) == "CCCC"
+
+
+def test_capacity_and_reserve():
+    # pre-sizing is behaviorally transparent
+    cg = oxli.KmerCountTable(ksize=4, capacity=1000)
+    cg.reserve(5000)
+
+    assert len(cg) == 0
+    assert cg.count("AAAA") == 1
+    assert cg.get("AAAA") == 1
+
+
 def test_hash_rc():
     table = create_sample_kmer_table(3, ["AAA", "TTT", "AAC"])
     hash_aaa = table.hash_kmer("AAA")  # 10679328328772601858
@@ -61,6 +111,39 @@ def test_consume():
     assert cg.get("ATCG") == 1
 
 
+def test_consume_bytes():
+    # consume also accepts bytes, skipping UTF-8 conversion
+    cg = oxli.KmerCountTable(4)
+
+    assert cg.consume(b"ATCG") == 1
+    assert cg.get("ATCG") == 1
+
+
+def test_consume_bytes_store_kmers():
+    cg = oxli.KmerCountTable(4, store_kmers=True)
+
+    assert cg.consume(b"ATCGG") == 2
+    assert cg.unhash(cg.hash_kmer("ATCG")) == "ATCG"
+
+
+def test_consume_batch():
+    # consume several sequences in one call
+    cg = oxli.KmerCountTable(4)
+
+    assert cg.consume_batch(["ATCGG", "GGGGG"]) == 4
+    assert cg.get("ATCG") == 1
+    assert cg.get("TCGG") == 1
+    assert cg.get("GGGG") == 2
+    assert cg.consumed == 10
+
+
+def test_consume_batch_bad_DNA():
+    cg = oxli.KmerCountTable(4)
+
+    with pytest.raises(ValueError, match="bad k-mer encountered"):
+        cg.consume_batch(["ATCG", "ATXG"], skip_bad_kmers=False)
+
+
 def test_consume_2():
     # test reverse complement
     cg = oxli.KmerCountTable(4)
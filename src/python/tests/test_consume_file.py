@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+import oxli
+
+EXAMPLE_FA = Path(__file__).resolve().parents[3] / "doc" / "example.fa"
+
+
+def read_fasta_seq(path):
+    """Concatenate the sequence lines of a single-record FASTA file."""
+    with open(path) as fp:
+        return "".join(line.strip() for line in fp if not line.startswith(">"))
+
+
+def test_consume_file():
+    table = oxli.KmerCountTable(ksize=21)
+    n_kmers = table.consume_file(str(EXAMPLE_FA))
+
+    assert n_kmers > 0
+    assert table.consumed == len(read_fasta_seq(EXAMPLE_FA))
+
+
+def test_consume_file_matches_consume():
+    # consuming a file should give the same table as consuming the
+    # concatenated sequence directly
+    table_file = oxli.KmerCountTable(ksize=21)
+    table_str = oxli.KmerCountTable(ksize=21)
+
+    n_file = table_file.consume_file(str(EXAMPLE_FA))
+    n_str = table_str.consume(read_fasta_seq(EXAMPLE_FA))
+
+    assert n_file == n_str
+    assert len(table_file) == len(table_str)
+    assert table_file.sum_counts == table_str.sum_counts
+
+
+def test_consume_file_missing():
+    table = oxli.KmerCountTable(ksize=21)
+
+    with pytest.raises(OSError):
+        table.consume_file("/path/does/not/exist.fa")
@@ -281,3 +281,13 @@ def test_consume_invalid_kmers(capfd):
         assert (
             stored_kmer == kmer
         ), f"Expected stored k-mer to be {kmer}, but got {stored_kmer}"
+
+
+def test_iter_matches_list():
+    "streaming iterator yields the same pairs as kmers_and_hashes."
+    seq = "ACGTTGATTCA"
+    cg = oxli.KmerCountTable(ksize=4)
+
+    expected = cg.kmers_and_hashes(seq, False)
+    it = cg.kmers_and_hashes_iter(seq, False)
+    assert list(it) == expected
@@ -1,6 +1,7 @@
 import gzip
 import json
 
+import numpy as np
 import pytest
 
 from oxli import KmerCountTable
@@ -9,9 +10,12 @@ from test_attr import get_version_from_cargo_toml
 CURRENT_VERSION = get_version_from_cargo_toml()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_kmer_table():
-    """Fixture that provides a sample KmerCountTable object."""
+    """Fixture that provides a sample KmerCountTable object.
+
+    Module-scoped: the tests below only read from it, so it is built once.
+    """
     table = KmerCountTable(ksize=4)
     table.count("AAAA")
     table.count("TTTT")
@@ -61,7 +65,28 @@ def test_save_load_roundtrip(sample_kmer_table, tmp_path):
     assert loaded_table.get("TTTT") == sample_kmer_table.get(
         "TTTT"
     ), "Counts for reverse complement should be preserved."
-    assert list(loaded_table) == list(sample_kmer_table), "All records in same order."
+    # Compare the hash arrays directly rather than materializing two
+    # lists of Python tuples.
+    assert np.array_equal(
+        loaded_table.hashes, sample_kmer_table.hashes
+    ), "All records in same order."
+
+
+def test_save_load_roundtrip_store_kmers(tmp_path):
+    """
+    Test that the hash:kmer mapping survives a save/load roundtrip.
+    """
+    table = KmerCountTable(ksize=4, store_kmers=True)
+    table.count("AAAA")
+    table.count("GGGG")
+    temp_file = str(tmp_path / "save.json")
+
+    table.save(temp_file)
+    loaded_table = KmerCountTable.load(temp_file)
+
+    assert loaded_table.unhash(table.hash_kmer("AAAA")) == "AAAA"
+    assert loaded_table.unhash(table.hash_kmer("GGGG")) == "CCCC"
+    assert sorted(loaded_table.dump_kmers()) == sorted(table.dump_kmers())
 
 
 def test_version_warning_on_load_stderr(sample_kmer_table, tmp_path, capfd):
@@ -75,10 +100,11 @@ def test_version_warning_on_load_stderr(sample_kmer_table, tmp_path, capfd):
     # Save the table to a file
     sample_kmer_table.save(temp_file)
 
-    # Mock the current version to simulate a version mismatch
+    # Mock the current version to simulate a version mismatch. The
+    # replacement is already valid JSON, so write the bytes directly.
     mock_json = sample_kmer_table.serialize_json().replace(CURRENT_VERSION, "0.0.1")
-    with gzip.open(temp_file, "wt") as f:
-        json.dump(json.loads(mock_json), f)
+    with gzip.open(temp_file, "wb", compresslevel=1) as f:
+        f.write(mock_json.encode())
 
     # Capture stderr output
     loaded_table = KmerCountTable.load(temp_file)
@@ -115,3 +141,49 @@ def test_save_bad_path(sample_kmer_table, tmp_path, capfd):
 
     with pytest.raises(OSError, match="No such file or directory"):
         sample_kmer_table.save(temp_file)
+
+
+def test_save_load_roundtrip_long_kmers(tmp_path):
+    """
+    Test the binary roundtrip for k > 32, where k-mers are stored as strings.
+    """
+    table = KmerCountTable(ksize=33, store_kmers=True)
+    kmer = "A" * 32 + "C"
+    table.count(kmer)
+    temp_file = str(tmp_path / "save.bin")
+
+    table.save(temp_file)
+    loaded_table = KmerCountTable.load(temp_file)
+
+    assert loaded_table.get(kmer) == 1
+    assert loaded_table.unhash(table.hash_kmer(kmer)) == table.unhash(
+        table.hash_kmer(kmer)
+    )
+
+
+def test_save_json_roundtrip(sample_kmer_table, tmp_path):
+    """
+    Test that the legacy gzipped-JSON format is still written by save_json
+    and read back transparently by load.
+    """
+    temp_file = str(tmp_path / "save.json")
+
+    sample_kmer_table.save_json(temp_file)
+    loaded_table = KmerCountTable.load(temp_file)
+
+    assert loaded_table.get("AAAA") == sample_kmer_table.get("AAAA")
+    assert loaded_table.version == sample_kmer_table.version
+
+
+def test_pickle_roundtrip(sample_kmer_table):
+    """
+    Test that tables pickle and unpickle through the binary format.
+    """
+    import pickle
+
+    data = pickle.dumps(sample_kmer_table)
+    loaded_table = pickle.loads(data)
+
+    assert loaded_table.get("AAAA") == sample_kmer_table.get("AAAA")
+    assert loaded_table.get("TTTT") == sample_kmer_table.get("TTTT")
+    assert loaded_table.version == sample_kmer_table.version